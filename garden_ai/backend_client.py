@@ -1,13 +1,18 @@
-import json
 import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum
 from dataclasses import dataclass
-from typing import Optional, Callable
+from typing import Callable, List, Optional, Tuple
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 from garden_ai.constants import GardenConstants
 from garden_ai.gardens import Garden
+from garden_ai.utils.misc import garden_json_encoder
 
 logger = logging.getLogger()
 
@@ -31,13 +36,46 @@ class PresignedUrlDirection(Enum):
 
 # Client for the Garden backend API. The name "GardenClient" was taken :)
 class BackendClient:
+    # how long (in seconds) to reuse an authorization header before asking the
+    # authorizer again. Kept short of globus_sdk's 60s early-refresh window, so
+    # a cached token always has time left on it.
+    AUTH_HEADER_TTL = 30
+
     def __init__(self, garden_authorizer):
         self.garden_authorizer = garden_authorizer
+        self._base_url = GardenConstants.GARDEN_ENDPOINT
+        self._auth_header: Optional[str] = None
+        self._auth_header_expiry = 0.0
+        # share one pooled session across calls so keep-alive connections
+        # (and their TLS handshakes) are reused between requests
+        self._session = self._new_session()
+        # requests.Session isn't guaranteed to be thread-safe, so publishing
+        # worker threads each keep a session of their own (see _post_batch)
+        self._thread_local = threading.local()
+        self._worker_sessions: List[requests.Session] = []
+        # one long-lived pool, so worker threads (and their sessions' pooled
+        # connections) are reused between publish calls. Started on first use.
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @staticmethod
+    def _new_session() -> requests.Session:
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+        return session
 
     def _call(self, http_verb: Callable, resource: str, payload: dict) -> dict:
-        headers = {"Authorization": self.garden_authorizer.get_authorization_header()}
-        url = GardenConstants.GARDEN_ENDPOINT + resource
-        resp = http_verb(url, headers=headers, json=payload)
+        headers = {
+            "Authorization": self._get_authorization_header(),
+            "Content-Type": "application/json",
+        }
+        url = self._base_url + resource
+        # serialize the payload ourselves so that e.g. expanded garden metadata
+        # (with UUIDs etc.) can be sent as-is, without a round trip through a str
+        data = orjson.dumps(payload, default=garden_json_encoder)
+        resp = http_verb(url, headers=headers, data=data)
+        if resp.status_code == 401:
+            # e.g. the token was revoked or rotated; don't keep sending it
+            self._auth_header = None
         try:
             resp.raise_for_status()
             return resp.json()
@@ -50,11 +88,43 @@ class BackendClient:
             logger.error(f"Could not parse response as JSON. {resp.text}")
             raise
 
+    def _get_authorization_header(self) -> str:
+        now = time.monotonic()
+        if self._auth_header is not None and now <= self._auth_header_expiry:
+            return self._auth_header
+        header: str = self.garden_authorizer.get_authorization_header()
+        self._auth_header = header
+        self._auth_header_expiry = now + self.AUTH_HEADER_TTL
+        return header
+
     def _post(self, resource: str, payload: dict) -> dict:
-        return self._call(requests.post, resource, payload)
+        return self._call(self._session.post, resource, payload)
 
     def _put(self, resource: str, payload: dict) -> dict:
-        return self._call(requests.put, resource, payload)
+        return self._call(self._session.put, resource, payload)
+
+    def _post_batch(self, resource: str, payload: dict) -> dict:
+        # called from publishing worker threads, never the caller's thread
+        session = getattr(self._thread_local, "session", None)
+        if session is None:
+            session = self._thread_local.session = self._new_session()
+            self._worker_sessions += [session]
+        return self._call(session.post, resource, payload)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=8)
+        return self._executor
+
+    def close(self):
+        """Shut down the publishing worker threads and close all pooled connections."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        for session in self._worker_sessions:
+            session.close()
+        self._worker_sessions = []
+        self._session.close()
 
     def mint_doi_on_datacite(self, payload: dict) -> str:
         response_dict = self._post("/doi", payload)
@@ -63,16 +133,102 @@ class BackendClient:
             raise Exception("Failed to mint DOI. Response was missing doi field.")
         return doi
 
+    def mint_dois(self, payloads: List[dict]) -> List[str]:
+        """Mint a DOI for each payload with a single request to the backend.
+
+        DOIs are returned in the same order as the given payloads.
+        """
+        if not payloads:
+            return []
+        response_dict = self._post("/doi/batch", {"items": payloads})
+        items = response_dict.get("items", None)
+        if not items or len(items) != len(payloads):
+            raise Exception(
+                "Failed to mint DOIs. Response did not include a result for every request."
+            )
+        dois = [item.get("doi", None) for item in items]
+        if not all(dois):
+            raise Exception("Failed to mint DOIs. Response was missing doi field.")
+        return dois
+
     def update_doi_on_datacite(self, payload: dict):
         self._put("/doi", payload)
 
     def publish_garden_metadata(self, garden: Garden):
-        payload = json.loads(garden.expanded_json())
-        self._post("/garden-search-record", payload)
+        self._post("/garden-search-record", garden.expanded_metadata())
+
+    def publish_gardens_async(
+        self, gardens: List[Garden], batch_size: int = 8
+    ) -> List[Future]:
+        """Publish metadata for several gardens as small, concurrently-submitted batches.
+
+        Each batch is submitted as soon as its payload is built, so preparing
+        the remaining batches overlaps with the backend handling earlier ones.
+
+        Returns:
+            One future per batch, in order, each resolving to the backend's response.
+        """
+        return self._submit_garden_batches(self._get_executor(), gardens, batch_size)
+
+    def publish_gardens(self, gardens: List[Garden], batch_size: int = 8):
+        """Blocking counterpart of ``publish_gardens_async``.
+
+        Raises:
+            Any exception raised by a failed batch request.
+        """
+        futures = self._submit_garden_batches(self._get_executor(), gardens, batch_size)
+        for future in futures:
+            future.result()
+
+    def _submit_garden_batches(
+        self, executor: ThreadPoolExecutor, gardens: List[Garden], batch_size: int
+    ) -> List[Future]:
+        futures = []
+        for i in range(0, len(gardens), batch_size):
+            chunk = gardens[i : i + batch_size]
+            payload = {"items": [g.expanded_metadata() for g in chunk]}
+            futures += [
+                executor.submit(
+                    self._post_batch, "/garden-search-record/batch", payload
+                )
+            ]
+        return futures
 
     def get_presigned_url(self, full_model_name: str, direction: PresignedUrlDirection):
         payload = {"s3_path": full_model_name, "direction": direction.value}
         response_dict = self._post("/presigned-url", payload)
+        return self._parse_presigned_url_response(response_dict, direction)
+
+    def get_presigned_urls(
+        self, entries: List[Tuple[str, PresignedUrlDirection]]
+    ) -> List[PresignedUrlResponse]:
+        """Request presigned URLs for several (full_model_name, direction) pairs at once.
+
+        URLs are returned in the same order as the given entries.
+        """
+        if not entries:
+            return []
+        payload = {
+            "items": [
+                {"s3_path": full_model_name, "direction": direction.value}
+                for full_model_name, direction in entries
+            ]
+        }
+        response_dict = self._post("/presigned-url/batch", payload)
+        items = response_dict.get("items", None)
+        if not items or len(items) != len(entries):
+            raise PresignedURLException(
+                "Failed to generate presigned URLs for model file transfer. Response did not include a result for every request."
+            )
+        return [
+            self._parse_presigned_url_response(item, direction)
+            for item, (_, direction) in zip(items, entries)
+        ]
+
+    @staticmethod
+    def _parse_presigned_url_response(
+        response_dict: dict, direction: PresignedUrlDirection
+    ) -> PresignedUrlResponse:
         url = response_dict.get("url", None)
         fields = response_dict.get("fields", None)
         if not url:
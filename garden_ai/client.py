@@ -461,6 +461,8 @@ class GardenClient:
             raise Exception(
                 f"Request to Garden backend to publish garden failed with error: {str(e)}"
             )
+        # don't let get_published_garden serve the pre-publish metadata
+        garden_search.forget_remote_garden(garden.doi)
 
     def search(self, query: str) -> str:
         """
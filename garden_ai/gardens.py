@@ -5,6 +5,7 @@ import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional, cast
 
+import orjson
 from pydantic import (
     BaseModel,
     Field,
@@ -230,7 +231,7 @@ class Garden(BaseModel):
         See: ``Garden.expanded_metadata`` method
         """
         data = self.expanded_metadata()
-        return json.dumps(data, default=garden_json_encoder)
+        return orjson.dumps(data, default=garden_json_encoder).decode()
 
     def datacite_json(self) -> JSON:
         """Parse this `Garden`s metadata into a DataCite-schema-compliant JSON string."""
@@ -241,7 +242,7 @@ class Garden(BaseModel):
         # The JSON returned by this method would be the "attributes" part of a DataCite request body.
 
         self._sync_author_metadata()
-        return DataciteSchema(  # type: ignore
+        schema = DataciteSchema(  # type: ignore
             identifiers=[Identifier(identifier=self.doi, identifierType="DOI")],
             types=Types(resourceType="AI/ML Garden", resourceTypeGeneral="Software"),
             creators=[Creator(name=name) for name in self.authors],
@@ -268,7 +269,8 @@ class Garden(BaseModel):
             ]
             if self.description
             else None,
-        ).json()
+        )
+        return orjson.dumps(schema.dict(), default=garden_json_encoder).decode()
 
     def validate(self):
         """Helper: perform validation on all fields, even fields which are still defaults."""
@@ -1,4 +1,5 @@
-import json
+import time
+from typing import Dict, List, Optional, Tuple
 
 from garden_ai.gardens import Garden
 from globus_sdk import SearchClient, GlobusAPIError
@@ -7,14 +8,124 @@ from pydantic import ValidationError
 # garden-dev index
 GARDEN_INDEX_UUID = "58e4df29-4492-4e7d-9317-b27eba62a911"
 
+# how long (in seconds) to reuse garden metadata already fetched from search
+SEARCH_CACHE_TTL = 60
+# mapping of (index uuid, doi): (time fetched, garden metadata)
+_search_cache: Dict[Tuple[str, str], Tuple[float, dict]] = {}
+
 
 class RemoteGardenException(Exception):
     """Exception raised when a requested Garden cannot be found or published"""
 
 
 def get_remote_garden_by_doi(
-    doi: str, env_vars: dict, search_client: SearchClient
+    doi: str, env_vars: dict, search_client: SearchClient, use_cache: bool = True
 ) -> Garden:
+    now = time.monotonic()
+    cached = _cached_metadata(doi, now) if use_cache else None
+    if cached is not None:
+        return _garden_from_metadata(cached, env_vars)
+
+    garden_meta = _fetch_garden_metadata(doi, search_client)
+    garden = _garden_from_metadata(garden_meta, env_vars)
+    # only cache metadata that made a valid garden, so a retry fetches again
+    _search_cache[(GARDEN_INDEX_UUID, doi)] = (now, garden_meta)
+    return garden
+
+
+def get_remote_gardens_by_dois(
+    dois: List[str], env_vars: dict, search_client: SearchClient, use_cache: bool = True
+) -> Dict[str, Garden]:
+    """Fetch several published gardens at once, with a single search query for \
+    any that aren't already cached.
+
+    Returns:
+        A dict mapping each DOI to its Garden. DOIs with no published garden \
+        are omitted.
+    """
+    now = time.monotonic()
+    metadata: Dict[str, dict] = {}
+    missing = []
+    for doi in dict.fromkeys(dois):
+        cached = _cached_metadata(doi, now) if use_cache else None
+        if cached is not None:
+            metadata[doi] = cached
+        else:
+            missing += [doi]
+
+    if missing:
+        query = " OR ".join(f'(doi: "{_escape_query_string(doi)}")' for doi in missing)
+        try:
+            res = search_client.search(
+                GARDEN_INDEX_UUID, query, advanced=True, limit=len(missing)
+            )
+        except GlobusAPIError as e:
+            raise RemoteGardenException(
+                f"Could not reach index {GARDEN_INDEX_UUID}"
+            ) from e
+        # the query can match records we didn't ask for, and DOIs are
+        # case-insensitive, so map each hit back to the DOI that was requested
+        requested = {doi.lower(): doi for doi in missing}
+        fetched = {}
+        try:
+            # the sdk already parsed the body when it built the response
+            for result in res.data["gmeta"]:
+                garden_meta = result["entries"][0]["content"]
+                doi = requested.get(str(garden_meta["doi"]).lower())
+                if doi is not None:
+                    fetched[doi] = garden_meta
+        except (KeyError, IndexError, TypeError) as e:
+            raise RemoteGardenException(
+                f"Could not parse search response {res.text}"
+            ) from e
+        metadata.update(fetched)
+    else:
+        fetched = {}
+
+    gardens = {
+        doi: _garden_from_metadata(garden_meta, env_vars)
+        for doi, garden_meta in metadata.items()
+    }
+    # only cache metadata that made a valid garden, so a retry fetches again
+    for doi, garden_meta in fetched.items():
+        _search_cache[(GARDEN_INDEX_UUID, doi)] = (now, garden_meta)
+    return gardens
+
+
+def _cached_metadata(doi: str, now: float) -> Optional[dict]:
+    """Helper: the cached metadata for this DOI, if it was fetched less than \
+    ``SEARCH_CACHE_TTL`` seconds before ``now``."""
+    hit = _search_cache.get((GARDEN_INDEX_UUID, doi))
+    if hit and now - hit[0] < SEARCH_CACHE_TTL:
+        return hit[1]
+    return None
+
+
+def _escape_query_string(value: str) -> str:
+    """Helper: escape a value for use inside a double-quoted advanced search term."""
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def forget_remote_garden(doi: str) -> None:
+    """Drop any cached search metadata for this DOI, e.g. after (re)publishing it."""
+    _search_cache.pop((GARDEN_INDEX_UUID, doi), None)
+
+
+def _garden_from_metadata(garden_meta: dict, env_vars: dict) -> Garden:
+    try:
+        garden = Garden(**garden_meta)
+    except ValidationError as e:
+        raise RemoteGardenException(
+            f"Could not parse search response {garden_meta}"
+        ) from e
+    garden._env_vars = env_vars
+    garden._set_pipelines_from_remote_metadata(garden_meta["pipelines"])
+    return garden
+
+
+def _fetch_garden_metadata(doi: str, search_client: SearchClient) -> dict:
+    # gardens are indexed with their doi as subject, so a direct subject lookup
+    # already returns only the one record we need (no query/limit required)
     try:
         res = search_client.get_subject(GARDEN_INDEX_UUID, doi)
     except GlobusAPIError as e:
@@ -27,15 +138,12 @@ def get_remote_garden_by_doi(
                 f"Could not reach index {GARDEN_INDEX_UUID}"
             ) from e
     try:
-        garden_meta = json.loads(res.text)["entries"][0]["content"]
-        garden = Garden(**garden_meta)
-    except (ValueError, KeyError, IndexError, ValidationError) as e:
+        # res.data is None if the body wasn't JSON
+        return res.data["entries"][0]["content"]
+    except (KeyError, IndexError, TypeError) as e:
         raise RemoteGardenException(
             f"Could not parse search response {res.text}"
         ) from e
-    garden._env_vars = env_vars
-    garden._set_pipelines_from_remote_metadata(garden_meta["pipelines"])
-    return garden
 
 
 def search_gardens(query: str, search_client: SearchClient) -> str:
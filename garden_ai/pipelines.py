@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-import json
 import logging
 import pathlib
 import sys
 from datetime import datetime
-from functools import reduce
+from functools import lru_cache
 from inspect import signature
 from keyword import iskeyword
 from typing import Any, Dict, List, Optional, Tuple, Union
@@ -13,6 +12,7 @@ from uuid import UUID
 
 import dparse  # type: ignore
 import globus_compute_sdk  # type: ignore
+import orjson
 from packaging.requirements import InvalidRequirement, Requirement
 from pydantic import BaseModel, Field, PrivateAttr, root_validator, validator
 from pydantic.dataclasses import dataclass
@@ -33,14 +33,51 @@ from garden_ai.mlmodel import RegisteredModel
 from garden_ai.steps import DataclassConfig, Step
 from garden_ai.utils.misc import (
     JSON,
+    check_composable,
+    compose_steps,
     garden_json_encoder,
     read_conda_deps,
-    safe_compose,
 )
 
 logger = logging.getLogger()
 
 
+@lru_cache(maxsize=4096)
+def _parse_req(req: str) -> Requirement:
+    """Helper: parse a pip requirement, memoized since the same pinned \
+    requirements tend to recur across steps."""
+    return Requirement(req)
+
+
+def _read_requirements_txt(requirements_file: str) -> List[str]:
+    """Helper: read the pip requirements listed in a requirements.txt file.
+
+    Files containing only plain PEP 508 requirement lines (and full-line
+    comments) are parsed directly; anything fancier (e.g. inline comments,
+    `-r other.txt` or `--hash` options) is handed off to dparse.
+    """
+    contents = pathlib.Path(requirements_file).read_bytes().decode("utf-8")
+    lines = []
+    for line in contents.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("-") or "#" in line:
+            break
+        try:
+            _parse_req(line)
+        except InvalidRequirement:
+            break
+        lines += [line]
+    else:
+        return lines
+
+    parsed = dparse.parse(contents, path=requirements_file, resolve=True).serialize()
+    lines = [d["line"] for d in parsed["dependencies"]]
+    lines += [d["line"] for d in parsed["resolved_dependencies"]]
+    return lines
+
+
 @dataclass(config=DataclassConfig)
 class Pipeline:
     """The `Pipeline` class represents a sequence of simpler `steps` composed \
@@ -147,7 +184,10 @@ class Pipeline:
         if len(steps) == 0:
             raise ValueError("Cannot have no steps in a pipeline.")
         try:
-            reduce(safe_compose, reversed(steps))
+            # only type-check adjacent steps here; the actual composition
+            # happens once, in __post_init_post_parse__
+            for g, f in zip(steps, steps[1:]):
+                check_composable(f, g)
         except TypeError as e:
             logger.error(e)
             raise
@@ -187,7 +227,7 @@ class Pipeline:
     @validator("pip_dependencies", each_item=True)
     def pip_deps_parsable(cls, pip_dep):
         try:
-            _ = Requirement(pip_dep)
+            _ = _parse_req(pip_dep)
         except InvalidRequirement as e:
             raise ValueError(f"Could not parse pip dependency '{pip_dep}'") from e
         return pip_dep
@@ -204,6 +244,9 @@ class Pipeline:
             "system": ".".join(map(str, sys.version_info[:3])),
             "pipeline": self.python_version,
         }
+        # accumulate deps as sets so they're deduplicated as we go
+        pip_dependencies = set(self.pip_dependencies)
+        conda_dependencies = set(self.conda_dependencies)
         # collect explicit pipeline dependencies for the container
         if self.requirements_file:
             if self.requirements_file.endswith((".yml", ".yaml")):
@@ -212,29 +255,22 @@ class Pipeline:
                 )
                 if py_version:
                     py_versions["pipeline"] = py_version
-                self.conda_dependencies += conda_deps
-                self.pip_dependencies += pip_deps
+                conda_dependencies.update(conda_deps)
+                pip_dependencies.update(pip_deps)
 
             elif self.requirements_file.endswith(".txt"):
-                with open(self.requirements_file, "r") as f:
-                    contents = f.read()
-                    parsed = dparse.parse(
-                        contents, path=self.requirements_file, resolve=True
-                    ).serialize()
-                    deps = [d["line"] for d in parsed["dependencies"]]
-                    deps.extend(d["line"] for d in parsed["resolved_dependencies"])
-                    self.pip_dependencies += set(deps)
+                pip_dependencies.update(_read_requirements_txt(self.requirements_file))
 
         # inspect steps to warn about possible dependency issues, but don't keep them for container.
         # step requirements are typically inferred (via mlflow) from their models, which is
         # prone to breaking (e.g. https://github.com/Garden-AI/garden/issues/135)
         explicit_requirements = {
-            Requirement(r).name: Requirement(r) for r in self.pip_dependencies
+            _parse_req(r).name: _parse_req(r) for r in pip_dependencies
         }
 
         for step in self.steps:
             for r in step.pip_dependencies:
-                requirement = Requirement(r)
+                requirement = _parse_req(r)
                 # warn about step requirements we're ignoring in favor of the pipeline's
                 would_ignore_req = (
                     requirement.name in explicit_requirements
@@ -255,7 +291,7 @@ class Pipeline:
             # same for conda deps -- note that these were likely explicitly added,
             # since mlflow-inferred requirements usually aren't conda.
             for r in step.conda_dependencies:
-                if r not in self.conda_dependencies:
+                if r not in conda_dependencies:
                     logger.warning(
                         f"Warning: step {step.__name__} has inferred a conda requirement '{r}', which is not required by the pipeline. "
                         f"If this package needs to be present in the container, please add '{r}' to the pipeline's requirements."
@@ -265,8 +301,8 @@ class Pipeline:
             py_versions[step.__name__] = step.python_version
 
         self.python_version = py_versions["pipeline"] or py_versions["system"]
-        self.conda_dependencies = list(set(self.conda_dependencies))
-        self.pip_dependencies = list(set(self.pip_dependencies))
+        self.conda_dependencies = list(conda_dependencies)
+        self.pip_dependencies = list(pip_dependencies)
 
         distinct_py_versions = set(
             py_versions[k] for k in py_versions if py_versions[k]
@@ -309,25 +345,33 @@ class Pipeline:
         # - Build a single composite function from this pipeline's steps
         # - Update metadata like signature, authors w/r/t underlying steps
         # - Infer conda and pip dependencies from steps and requirements file
-        self._composed_steps = reduce(safe_compose, reversed(self.steps))
+        self._composed_steps = compose_steps(self.steps)
         self.__signature__ = signature(self._composed_steps)
+        # (metadata, json) of the most recent datacite_json() call
+        self._datacite_cache: Optional[Tuple[tuple, JSON]] = None
         self._sync_author_metadata()
         self._collect_requirements()
         return
 
     def _sync_author_metadata(self):
-        known_authors = set(self.authors)
-        known_contributors = set(self.contributors)
+        known_authors = frozenset(self.authors)
+        # dict rather than set so contributors keep a stable order, which
+        # keeps the datacite_json cache key stable between calls too
+        known_contributors = dict.fromkeys(self.contributors)
         for step in self.steps:
-            new_contributors = set(step.authors) | set(step.contributors)
-            known_contributors |= new_contributors - known_authors
+            known_contributors.update(
+                (a, None) for a in step.authors if a not in known_authors
+            )
+            known_contributors.update(
+                (c, None) for c in step.contributors if c not in known_authors
+            )
         self.contributors = list(known_contributors)
         return
 
     def json(self) -> JSON:
         """Helper: serialize pipeline metadata to JSON string."""
         self._sync_author_metadata()
-        return json.dumps(self, default=garden_json_encoder)
+        return orjson.dumps(self, default=garden_json_encoder).decode()
 
     def datacite_json(self) -> JSON:
         """Parse this `Pipeline`'s metadata into a DataCite-schema-compliant JSON string."""
@@ -338,7 +382,21 @@ class Pipeline:
         # The JSON returned by this method would be the "attributes" part of a DataCite request body.
 
         self._sync_author_metadata()
-        return DataciteSchema(
+        # skip rebuilding the schema if none of the relevant metadata has changed
+        key = (
+            tuple(self.authors),
+            tuple(self.contributors),
+            tuple(self.tags),
+            self.title,
+            self.description,
+            self.doi,
+            self.year,
+            self.version,
+        )
+        if self._datacite_cache and self._datacite_cache[0] == key:
+            return self._datacite_cache[1]
+
+        schema = DataciteSchema(
             identifiers=[Identifier(identifier=self.doi, identifierType="DOI")],
             types=Types(resourceType="AI/ML Pipeline", resourceTypeGeneral="Software"),  # type: ignore
             creators=[Creator(name=name) for name in self.authors],
@@ -356,16 +414,17 @@ class Pipeline:
             ]
             if self.description
             else None,
-        ).json()
+        )
+        datacite_json = orjson.dumps(
+            schema.dict(), default=garden_json_encoder
+        ).decode()
+        self._datacite_cache = (key, datacite_json)
+        return datacite_json
 
     def dict(self) -> Dict[str, Any]:
         """Helper: serialize pipeline metadata to dictionary."""
-        d = {}
-        for key in self.__dataclass_fields__:
-            val = getattr(self, key)
-            if key == "steps":
-                val = [s.dict() for s in val]
-            d[key] = val
+        d = {key: getattr(self, key) for key in self.__dataclass_fields__}
+        d["steps"] = [s.dict() for s in self.steps]
         return d
 
 
@@ -471,12 +530,14 @@ class RegisteredPipeline(BaseModel):
                 If any fields required by `RegisteredPipeline` but not \
                 `Pipeline` (e.g. `doi`, `func_uuid`) are not set.
         """
-        # note: we want every RegisteredPipeline to be re-constructible
-        # from mere json, so as a sanity check we use pipeline.json() instead of
-        # pipeline.dict() directly
-        record = pipeline.json()
-        data = json.loads(record)
-        return cls(**data)
+        pipeline._sync_author_metadata()
+        data = pipeline.dict()
+        # note: we want every RegisteredPipeline to be re-constructible from
+        # mere json, so steps' functions are replaced with the same
+        # "name: signature" strings that pipeline.json() would produce
+        for step_data in data["steps"]:
+            step_data["func"] = garden_json_encoder(step_data["func"])
+        return cls.parse_obj(data)
 
     def collect_models(self) -> List[RegisteredModel]:
         """Collect the RegisteredModel objects that are present in the local DB corresponding to this Pipeline's list of `model_uris`."""
@@ -43,6 +43,30 @@ def test_garden_create(garden_all_fields, tmp_path, mocker):
     assert garden_all_fields.doi in re.compile(r"\x1b[^m]*m").sub("", result.stdout)
 
 
+@pytest.mark.cli
+def test_garden_create_prompts_for_authors(garden_all_fields, mocker):
+    mock_client = mocker.MagicMock(GardenClient)
+    mocker.patch("garden_ai.app.garden.GardenClient").return_value = mock_client
+    mocker.patch("garden_ai.app.garden.local_data.put_local_garden").return_value = None
+    mock_client.create_garden.return_value = garden_all_fields
+
+    command = [
+        "garden",
+        "create",
+        "--title",
+        "t",
+        "--description",
+        "d",
+        "--year",
+        "2023",
+    ]
+    result = runner.invoke(app, command, input="Gregor Mendel\n\n\n")
+    assert result.exit_code == 0
+
+    kwargs = mock_client.create_garden.call_args.kwargs
+    assert kwargs["authors"] == ["Gregor Mendel"]
+
+
 def test_garden_list(database_with_connected_pipeline, tmp_path, mocker):
     mocker.patch(
         "garden_ai.local_data.LOCAL_STORAGE", new=database_with_connected_pipeline
@@ -1,11 +1,11 @@
-from typing import List
+import copy
+from contextlib import ExitStack
+from types import SimpleNamespace
+from typing import List, Tuple, Union
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 import os
-from globus_compute_sdk import Client  # type: ignore
-from globus_sdk import AuthClient, OAuthTokenResponse, SearchClient
-from globus_sdk.tokenstorage import SimpleJSONFileAdapter
-from mlflow.pyfunc import PyFuncModel  # type: ignore
 
 import garden_ai
 from garden_ai import Garden, GardenClient, Pipeline, step
@@ -13,10 +13,40 @@ from garden_ai.pipelines import RegisteredPipeline
 from garden_ai.mlmodel import RegisteredModel, DatasetConnection
 from tests.fixtures.helpers import get_fixture_file_path  # type: ignore
 
+IDENTITY_JWT = "eyJhbGciOiJSUzUxMiIsInR5cCI6IkpXVCJ9.eyJzdWIiOiI2YzllMjIzZi1jMjE1LTRjMjYtOWFiYi0yNjJkYmNlMDAwMWMiLCJlbWFpbCI6IndpbGxlbmdsZXJAdWNoaWNhZ28uZWR1IiwibGFzdF9hdXRoZW50aWNhdGlvbiI6MTY3NjU2MjEyNiwiaWRlbnRpdHlfc2V0IjpbeyJzdWIiOiI2YzllMjIzZi1jMjE1LTRjMjYtOWFiYi0yNjJkYmNlMDAwMWMiLCJlbWFpbCI6IndpbGxlbmdsZXJAdWNoaWNhZ28uZWR1IiwibGFzdF9hdXRoZW50aWNhdGlvbiI6MTY3NjU2MjEyNn1dLCJpc3MiOiJodHRwczovL2F1dGguZ2xvYnVzLm9yZyIsImF1ZCI6ImNmOWY4OTM4LWZiNzItNDM5Yy1hNzBiLTg1YWRkZjFiODUzOSIsImV4cCI6MTY3Nzc4NzMzNCwiaWF0IjoxNjc3NjE0NTM0LCJhdF9oYXNoIjoiT1VMX0s3ZmVyNXNBdk03cEI0dXJnNE95dXZVOUxEcGh3SnhCX1VUXzY1cyJ9.TssuMsFeKFQH9Bd29c2Bj0V_f-KkN8alGtHnZOZbg5AQwVPokthHRA4bro7IHuOCXIoh3kX03KPNcLfyRRM5JN1d4SKl0L9KpkJB45BkKzKcg8KPgChOzs_9jRiiDwmXvIpgWiUNVI4grHIEYVpB_VdFdKw6EwWQgu6ZrN_2rvpa45Pc-NZ_-WR4WDFAx2Hak7sXRXslY_1ftlRgV9348uwp78jh1pnXft-mpgpzwqHVALLKgzecCESYmaipWTd3-atczpH9SPIxOn7DoiX2I2Nhn_8IkrhIZnbmtOyY7wINrSGFonN49AncVTNq9AfIngZB26spUByHW4mLB6E2Mw"  # noqa: E501
 
-@pytest.fixture(autouse=True)
-def do_not_sleep(mocker):
-    mocker.patch("time.sleep")
+TOKEN = {
+    "refresh_token": "MyRefreshToken",
+    "access_token": "MyAccessToken",
+    "expires_at_seconds": 1024,
+}
+
+# contents of the tmp_requirements_txt and tmp_conda_yml fixture files
+_REQS_BYTES = b"Flask==2.1.1\npandas>=1.3.0\nnumpy==1.21.2\nscikit-learn>=0.24.2\n"
+
+_CONDA_BYTES = b"""\
+name: my_env
+channels:
+- defaults
+dependencies:
+- python=3.8
+- flask=2.1.1
+- pandas>=1.3.0
+- pip:
+    - mlflow<3,>=2.2
+    - cloudpickle==2.2.1
+    - numpy==1.23.5
+    - psutil==5.9.4
+    - scikit-learn==1.2.2
+    - fake-package==9.9.9
+"""
+
+
+@pytest.fixture(scope="session", autouse=True)
+def do_not_sleep():
+    # patched once for the whole session, rather than once per test
+    with patch("time.sleep"):
+        yield
 
 
 @pytest.fixture(autouse=True)
@@ -41,18 +71,14 @@ def mock_authorizer_tuple(mocker):
     return mock_authorizer_constructor, mock_authorizer
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def identity_jwt():
-    return "eyJhbGciOiJSUzUxMiIsInR5cCI6IkpXVCJ9.eyJzdWIiOiI2YzllMjIzZi1jMjE1LTRjMjYtOWFiYi0yNjJkYmNlMDAwMWMiLCJlbWFpbCI6IndpbGxlbmdsZXJAdWNoaWNhZ28uZWR1IiwibGFzdF9hdXRoZW50aWNhdGlvbiI6MTY3NjU2MjEyNiwiaWRlbnRpdHlfc2V0IjpbeyJzdWIiOiI2YzllMjIzZi1jMjE1LTRjMjYtOWFiYi0yNjJkYmNlMDAwMWMiLCJlbWFpbCI6IndpbGxlbmdsZXJAdWNoaWNhZ28uZWR1IiwibGFzdF9hdXRoZW50aWNhdGlvbiI6MTY3NjU2MjEyNn1dLCJpc3MiOiJodHRwczovL2F1dGguZ2xvYnVzLm9yZyIsImF1ZCI6ImNmOWY4OTM4LWZiNzItNDM5Yy1hNzBiLTg1YWRkZjFiODUzOSIsImV4cCI6MTY3Nzc4NzMzNCwiaWF0IjoxNjc3NjE0NTM0LCJhdF9oYXNoIjoiT1VMX0s3ZmVyNXNBdk03cEI0dXJnNE95dXZVOUxEcGh3SnhCX1VUXzY1cyJ9.TssuMsFeKFQH9Bd29c2Bj0V_f-KkN8alGtHnZOZbg5AQwVPokthHRA4bro7IHuOCXIoh3kX03KPNcLfyRRM5JN1d4SKl0L9KpkJB45BkKzKcg8KPgChOzs_9jRiiDwmXvIpgWiUNVI4grHIEYVpB_VdFdKw6EwWQgu6ZrN_2rvpa45Pc-NZ_-WR4WDFAx2Hak7sXRXslY_1ftlRgV9348uwp78jh1pnXft-mpgpzwqHVALLKgzecCESYmaipWTd3-atczpH9SPIxOn7DoiX2I2Nhn_8IkrhIZnbmtOyY7wINrSGFonN49AncVTNq9AfIngZB26spUByHW4mLB6E2Mw"  # noqa: E501
+    return IDENTITY_JWT
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def token():
-    return {
-        "refresh_token": "MyRefreshToken",
-        "access_token": "MyAccessToken",
-        "expires_at_seconds": 1024,
-    }
+    return TOKEN
 
 
 @pytest.fixture
@@ -62,52 +88,76 @@ def noop_func_uuid():
 
 @pytest.fixture
 def mock_keystore(mocker):
-    mock_keystore = mocker.MagicMock(SimpleJSONFileAdapter)
+    mock_keystore = mocker.MagicMock()
     mocker.patch("garden_ai.client.SimpleJSONFileAdapter").return_value = mock_keystore
     return mock_keystore
 
 
-@pytest.fixture
-def garden_client(mocker, mock_authorizer_tuple, mock_keystore, token, identity_jwt):
-    # blindly stolen from test_client.py test
-
-    # mocker, mock_authorizer_tuple, token, mock_keystore
-    mock_authorizer_constructor, mock_authorizer = mock_authorizer_tuple
-    # Mocks for KeyStore
-    mock_keystore.file_exists.return_value = False
+@pytest.fixture(scope="session")
+def _garden_client_cached():
+    # blindly stolen from test_client.py test, but built once per session since
+    # tests only ever read from the client. The login flow only needs to be
+    # mocked while the client is being constructed.
+    from globus_sdk import AuthClient
+
+    mock_authorizer = Mock()
+    # Stub KeyStore with no saved tokens, so the login flow runs
+    mock_keystore = SimpleNamespace(
+        file_exists=lambda: False,
+        store=lambda *args, **kwargs: None,
+        get_token_data=lambda *args, **kwargs: TOKEN,
+        on_refresh=lambda *args, **kwargs: None,
+    )
 
     # Mocks for Login Flow
-    mock_auth_client = mocker.MagicMock(AuthClient)
-    mock_auth_client.oauth2_get_authorize_url = mocker.Mock(
+    mock_auth_client = MagicMock(AuthClient)
+    mock_auth_client.oauth2_get_authorize_url = Mock(
         return_value="https://globus.auth.garden"
     )
-    mock_auth_client.oauth2_start_flow = mocker.Mock()
-    # mocker.patch("garden_ai.client.input").return_value = "my token"
-    mocker.patch("garden_ai.client.Prompt.ask").return_value = "my token"
-    mocker.patch("garden_ai.client.typer.launch")
-    mock_search_client = mocker.MagicMock(SearchClient)
-
-    mock_token_response = mocker.MagicMock(OAuthTokenResponse)
-    mock_token_response.data = {"id_token": identity_jwt}
+    mock_auth_client.oauth2_start_flow = Mock()
+    mock_search_client = MagicMock()
+
+    mock_token_response = MagicMock()
+    mock_token_response.data = {"id_token": IDENTITY_JWT}
     mock_token_response.by_resource_server = {
-        "groups.api.globus.org": token,
-        "search.api.globus.org": token,
-        "0948a6b0-a622-4078-b0a4-bfd6d77d65cf": token,
-        "funcx_service": token,
-        "auth.globus.org": token,
+        "groups.api.globus.org": TOKEN,
+        "search.api.globus.org": TOKEN,
+        "0948a6b0-a622-4078-b0a4-bfd6d77d65cf": TOKEN,
+        "funcx_service": TOKEN,
+        "auth.globus.org": TOKEN,
     }
-    mock_auth_client.oauth2_exchange_code_for_tokens = mocker.Mock(
+    mock_auth_client.oauth2_exchange_code_for_tokens = Mock(
         return_value=mock_token_response
     )
 
-    # Call the Garden constructor
-    gc = GardenClient(auth_client=mock_auth_client, search_client=mock_search_client)
+    with ExitStack() as stack:
+        for target, kwargs in [
+            ("garden_ai.client.GardenClient._set_up_mlflow_env", {}),
+            (
+                "garden_ai.client.RefreshTokenAuthorizer",
+                {"return_value": mock_authorizer},
+            ),
+            ("garden_ai.client.SimpleJSONFileAdapter", {"return_value": mock_keystore}),
+            ("garden_ai.client.Prompt.ask", {"return_value": "my token"}),
+            ("garden_ai.client.typer.launch", {}),
+        ]:
+            stack.enter_context(patch(target, **kwargs))
+
+        # Call the Garden constructor
+        gc = GardenClient(
+            auth_client=mock_auth_client, search_client=mock_search_client
+        )
     return gc
 
 
+@pytest.fixture
+def garden_client(_garden_client_cached):
+    return _garden_client_cached
+
+
 @pytest.fixture
 def compute_client(mocker):
-    mock_compute_client = mocker.MagicMock(Client)
+    mock_compute_client = mocker.MagicMock()
     mock_compute_client.build_container = mocker.Mock(
         return_value="d1fc6d30-be1c-4ac4-a289-d87b27e84357"
     )
@@ -133,20 +183,31 @@ def garden_no_fields():
     return Garden(doi="10.26311/fake-doi")  # DOI is required to instantiate
 
 
-@pytest.fixture
-def pipeline_toy_example(tmp_requirements_txt):
+class Soup:
+    ...
+
+
+@pytest.fixture(scope="session")
+def split_peas_step():
     # define a step using the decorator
     @step(authors=["Sister Constance"])
     def split_peas(ps: List) -> List[tuple]:
         return [(p / 2, p / 2) for p in ps]
 
-    class Soup:
-        ...
+    return split_peas
 
+
+@pytest.fixture(scope="session")
+def make_soup_step():
     @step(authors=["Friar Hugo"])
     def make_soup(splits: List[tuple]) -> Soup:
         return Soup()
 
+    return make_soup
+
+
+@pytest.fixture(scope="module")
+def pipeline_toy_example(tmp_requirements_txt, split_peas_step, make_soup_step):
     @step(authors=["Abbot Mortimer"], input_info="a spoonful of Soup object")
     def rate_soup(soup_sample: Soup) -> float:
         return 10 / 10
@@ -155,24 +216,24 @@ def pipeline_toy_example(tmp_requirements_txt):
 
     pea_edibility_pipeline = Pipeline(
         title="Pea Edibility Pipeline",
-        steps=[split_peas, make_soup, rate_soup],
+        steps=[split_peas_step, make_soup_step, rate_soup],
         authors=["Brian Jacques"],
         description="A pipeline for perfectly-reproducible soup ratings.",
         requirements_file=str(tmp_requirements_txt),
         doi="10.26311/fake-doi",
     )
 
-    # the complete pipeline is now also callable by itself
-    assert pea_edibility_pipeline([1, 2, 3]) == 10 / 10
     return pea_edibility_pipeline
 
 
 @pytest.fixture
 def registered_pipeline_toy_example(pipeline_toy_example, noop_func_uuid):
-    pipeline_toy_example.doi = "10.26311/fake-doi"
-    pipeline_toy_example.func_uuid = noop_func_uuid
-    pipeline_toy_example.short_name = "pipeline_toy_example"
-    return RegisteredPipeline.from_pipeline(pipeline_toy_example)
+    # pipeline_toy_example is shared across the module, so don't modify it in place
+    pipeline = copy.copy(pipeline_toy_example)
+    pipeline.doi = "10.26311/fake-doi"
+    pipeline.func_uuid = noop_func_uuid
+    pipeline.short_name = "pipeline_toy_example"
+    return RegisteredPipeline.from_pipeline(pipeline)
 
 
 @pytest.fixture
@@ -192,50 +253,95 @@ def garden_all_fields(registered_pipeline_toy_example):
     return pea_garden
 
 
-@pytest.fixture
-def tmp_requirements_txt(tmp_path):
+@pytest.fixture(scope="session")
+def tmp_requirements_txt(tmp_path_factory):
     """
-    Fixture that creates a temporary requirements.txt file
+    Fixture that creates a temporary requirements.txt file, shared by the whole session (tests only read it)
     """
-    contents = "Flask==2.1.1\npandas>=1.3.0\nnumpy==1.21.2\nscikit-learn>=0.24.2\n"
-    file_path = tmp_path / "requirements.txt"
-    with open(file_path, "w") as f:
-        f.write(contents)
+    file_path = tmp_path_factory.mktemp("requirements") / "requirements.txt"
+    file_path.write_bytes(_REQS_BYTES)
     return file_path
 
 
-@pytest.fixture
-def tmp_conda_yml(tmp_path):
+@pytest.fixture(scope="session")
+def tmp_conda_yml(tmp_path_factory):
     """
-    Fixture that creates a temporary `conda.yml` file.
+    Fixture that creates a temporary `conda.yml` file, shared by the whole session (tests only read it).
     """
-    contents = """\
-name: my_env
-channels:
-- defaults
-dependencies:
-- python=3.8
-- flask=2.1.1
-- pandas>=1.3.0
-- pip:
-    - mlflow<3,>=2.2
-    - cloudpickle==2.2.1
-    - numpy==1.23.5
-    - psutil==5.9.4
-    - scikit-learn==1.2.2
-    - fake-package==9.9.9
-"""
-    file_path = tmp_path / "conda.yml"
-    with open(file_path, "w") as f:
-        f.write(contents)
+    file_path = tmp_path_factory.mktemp("conda") / "conda.yml"
+    file_path.write_bytes(_CONDA_BYTES)
     return file_path
 
 
-@pytest.fixture
-def step_with_model(mocker, tmp_conda_yml):
-    mock_model = mocker.MagicMock(PyFuncModel)
-    mocker.patch("garden_ai.mlmodel.load_model").return_value = mock_model
-    mocker.patch(
+@pytest.fixture(scope="module")
+def step_returns_tuple():
+    @step
+    def returns_tuple(a: int, b: str) -> Tuple[int, str]:
+        pass
+
+    return returns_tuple
+
+
+@pytest.fixture(scope="module")
+def step_wants_tuple_as_tuple():
+    @step
+    def wants_tuple_as_tuple(t: Tuple[int, str]) -> int:
+        pass
+
+    return wants_tuple_as_tuple
+
+
+@pytest.fixture(scope="module")
+def step_wants_tuple_as_args():
+    @step
+    def wants_tuple_as_args(x: int, y: str) -> str:
+        pass
+
+    return wants_tuple_as_args
+
+
+@pytest.fixture(scope="module")
+def step_wants_flipped_tuple_as_args():
+    @step
+    def wants_flipped_tuple_as_args(arg1: str, arg2: int) -> float:
+        pass
+
+    return wants_flipped_tuple_as_args
+
+
+@pytest.fixture(scope="module")
+def step_wants_int_or_str():
+    # note: (A | B) syntax requires python3.10 or higher
+    @step
+    def wants_int_or_str(arg: int | str) -> str | int:
+        pass
+
+    return wants_int_or_str
+
+
+@pytest.fixture(scope="module")
+def step_wants_int_or_str_old_syntax():
+    @step
+    def wants_int_or_str_old_syntax(arg: Union[int, str]) -> Union[str, int]:
+        pass
+
+    return wants_int_or_str_old_syntax
+
+
+@pytest.fixture(scope="module")
+def step_str_only():
+    @step
+    def str_only(arg: str) -> str:
+        pass
+
+    return str_only
+
+
+@pytest.fixture(scope="module")
+def step_with_model(module_mocker, tmp_conda_yml):
+    mock_model = module_mocker.MagicMock()
+    module_mocker.patch("garden_ai.mlmodel.load_model").return_value = mock_model
+    module_mocker.patch(
         "garden_ai.mlmodel.mlflow.pyfunc.get_model_dependencies"
     ).return_value = tmp_conda_yml
 
@@ -251,21 +357,11 @@ def step_with_model(mocker, tmp_conda_yml):
     return uses_model_in_default
 
 
-@pytest.fixture
-def pipeline_using_step_with_model(mocker, tmp_requirements_txt, step_with_model):
-    # define a step using the decorator
-    @step(authors=["Sister Constance"])
-    def split_peas(ps: List) -> List[tuple]:
-        return [(p / 2, p / 2) for p in ps]
-
-    class Soup:
-        ...
-
-    @step(authors=["Friar Hugo"])
-    def make_soup(splits: List[tuple]) -> Soup:
-        return Soup()
-
-    ALL_STEPS = (split_peas, make_soup, step_with_model)  # see fixture
+@pytest.fixture(scope="module")
+def pipeline_using_step_with_model(
+    tmp_requirements_txt, split_peas_step, make_soup_step, step_with_model
+):
+    ALL_STEPS = (split_peas_step, make_soup_step, step_with_model)  # see fixture
 
     pea_edibility_pipeline = Pipeline(
         title="Pea Edibility Pipeline",
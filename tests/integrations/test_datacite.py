@@ -1,3 +1,5 @@
+import copy
+
 import pytest
 
 
@@ -12,7 +14,8 @@ def test_auto_doi_garden(garden_client, garden_no_fields):
 
 @pytest.mark.integration
 def test_auto_doi_pipelines(garden_client, pipeline_toy_example):
-    pipe = pipeline_toy_example
+    # pipeline_toy_example is shared across the module, so don't modify it in place
+    pipe = copy.copy(pipeline_toy_example)
     pipe.authors = ["pytest"]
     pipe.title = "DOI request test (Pipeline)"
     pipe.doi = garden_client._mint_draft_doi()
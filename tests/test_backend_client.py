@@ -0,0 +1,244 @@
+import orjson
+import pytest
+import requests
+
+from garden_ai import Garden
+from garden_ai.backend_client import (
+    BackendClient,
+    PresignedURLException,
+    PresignedUrlDirection,
+    PresignedUrlResponse,
+)
+
+
+@pytest.fixture
+def backend_client(mocker):
+    mock_authorizer = mocker.Mock()
+    mock_authorizer.get_authorization_header.return_value = "Bearer fake-token"
+    client = BackendClient(mock_authorizer)
+    yield client
+    client.close()
+
+
+def mock_post_response(mocker, client, response_json):
+    mock_response = mocker.Mock()
+    mock_response.json.return_value = response_json
+    return mocker.patch.object(client._session, "post", return_value=mock_response)
+
+
+def test_mint_dois_in_order(mocker, backend_client):
+    mock_post = mock_post_response(
+        mocker,
+        backend_client,
+        {"items": [{"doi": "10.26311/first"}, {"doi": "10.26311/second"}]},
+    )
+
+    dois = backend_client.mint_dois([{"title": "first"}, {"title": "second"}])
+
+    assert dois == ["10.26311/first", "10.26311/second"]
+    assert mock_post.call_count == 1
+    assert mock_post.call_args.args[0].endswith("/doi/batch")
+
+
+def test_mint_dois_empty_makes_no_request(mocker, backend_client):
+    mock_post = mock_post_response(mocker, backend_client, {})
+    assert backend_client.mint_dois([]) == []
+    mock_post.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "response_json",
+    [
+        {},
+        {"items": [{"doi": "10.26311/first"}]},
+        {"items": [{"doi": "10.26311/first"}, {}]},
+    ],
+)
+def test_mint_dois_incomplete_response(mocker, backend_client, response_json):
+    mock_post_response(mocker, backend_client, response_json)
+    with pytest.raises(Exception):
+        backend_client.mint_dois([{"title": "first"}, {"title": "second"}])
+
+
+def test_get_presigned_urls_in_order(mocker, backend_client):
+    mock_post = mock_post_response(
+        mocker,
+        backend_client,
+        {
+            "items": [
+                {"url": "https://upload.url", "fields": {"key": "value"}},
+                {"url": "https://download.url"},
+            ]
+        },
+    )
+
+    urls = backend_client.get_presigned_urls(
+        [
+            ("me@example.com-model/1", PresignedUrlDirection.Upload),
+            ("me@example.com-model/2", PresignedUrlDirection.Download),
+        ]
+    )
+
+    assert urls == [
+        PresignedUrlResponse("https://upload.url", {"key": "value"}),
+        PresignedUrlResponse("https://download.url", None),
+    ]
+    assert mock_post.call_count == 1
+    assert mock_post.call_args.args[0].endswith("/presigned-url/batch")
+
+
+@pytest.mark.parametrize(
+    "response_json",
+    [
+        {},
+        {"items": []},
+        {"items": [{"url": "https://upload.url", "fields": {"key": "value"}}]},
+    ],
+)
+def test_get_presigned_urls_missing_items(mocker, backend_client, response_json):
+    mock_post_response(mocker, backend_client, response_json)
+    with pytest.raises(PresignedURLException):
+        backend_client.get_presigned_urls(
+            [
+                ("me@example.com-model/1", PresignedUrlDirection.Upload),
+                ("me@example.com-model/2", PresignedUrlDirection.Download),
+            ]
+        )
+
+
+@pytest.mark.parametrize(
+    "item, direction",
+    [
+        ({"fields": {"key": "value"}}, PresignedUrlDirection.Upload),
+        ({}, PresignedUrlDirection.Download),
+        ({"url": "https://upload.url"}, PresignedUrlDirection.Upload),
+    ],
+)
+def test_get_presigned_urls_bad_item(mocker, backend_client, item, direction):
+    mock_post_response(mocker, backend_client, {"items": [item]})
+    with pytest.raises(PresignedURLException):
+        backend_client.get_presigned_urls([("me@example.com-model/1", direction)])
+
+
+def test_publish_gardens_in_batches(mocker, backend_client):
+    mock_post = mocker.patch("requests.Session.post")
+    mock_post.return_value.json.return_value = {}
+    gardens = [
+        Garden(title=f"Garden {i}", authors=["Mendel, Gregor"], doi=f"10.26311/{i}")
+        for i in range(17)
+    ]
+
+    backend_client.publish_gardens(gardens, batch_size=8)
+
+    assert mock_post.call_count == 3
+    batches = []
+    for call in mock_post.call_args_list:
+        assert call.args[0].endswith("/garden-search-record/batch")
+        items = orjson.loads(call.kwargs["data"])["items"]
+        batches += [[item["doi"] for item in items]]
+    # batches may be sent in any order, but each holds a contiguous chunk
+    assert sorted(batches) == sorted(
+        [
+            [f"10.26311/{i}" for i in range(0, 8)],
+            [f"10.26311/{i}" for i in range(8, 16)],
+            ["10.26311/16"],
+        ]
+    )
+
+
+def test_publish_gardens_async_returns_future_per_batch(mocker, backend_client):
+    mock_post = mocker.patch("requests.Session.post")
+    mock_post.return_value.json.return_value = {"ok": True}
+    gardens = [
+        Garden(title=f"Garden {i}", authors=["Mendel, Gregor"], doi=f"10.26311/{i}")
+        for i in range(3)
+    ]
+
+    futures = backend_client.publish_gardens_async(gardens, batch_size=2)
+
+    assert [f.result() for f in futures] == [{"ok": True}, {"ok": True}]
+
+
+def test_publish_gardens_failed_batch_raises(mocker, backend_client):
+    ok_response = mocker.Mock()
+    ok_response.json.return_value = {}
+    bad_response = mocker.Mock()
+    bad_response.raise_for_status.side_effect = requests.HTTPError("500")
+    mocker.patch("requests.Session.post", side_effect=[ok_response, bad_response])
+    gardens = [
+        Garden(title=f"Garden {i}", authors=["Mendel, Gregor"], doi=f"10.26311/{i}")
+        for i in range(2)
+    ]
+
+    with pytest.raises(requests.HTTPError):
+        backend_client.publish_gardens(gardens, batch_size=1)
+
+
+def test_publish_gardens_reuses_workers(mocker, backend_client):
+    mock_post = mocker.patch("requests.Session.post")
+    mock_post.return_value.json.return_value = {}
+    gardens = [
+        Garden(title=f"Garden {i}", authors=["Mendel, Gregor"], doi=f"10.26311/{i}")
+        for i in range(17)
+    ]
+
+    backend_client.publish_gardens(gardens, batch_size=1)
+    executor = backend_client._executor
+    sessions = list(backend_client._worker_sessions)
+    backend_client.publish_gardens(gardens, batch_size=1)
+
+    # the same pool (and so the same per-thread sessions) serves both calls
+    assert backend_client._executor is executor
+    assert 1 <= len(sessions) <= 8
+    assert backend_client._worker_sessions[: len(sessions)] == sessions
+    assert len(backend_client._worker_sessions) <= 8
+
+
+def test_close_shuts_down_workers_and_sessions(mocker, backend_client):
+    mock_post = mocker.patch("requests.Session.post")
+    mock_post.return_value.json.return_value = {}
+    mock_close = mocker.patch("requests.Session.close")
+    backend_client.publish_gardens(
+        [Garden(title="Garden", authors=["Mendel, Gregor"], doi="10.26311/0")]
+    )
+    executor = backend_client._executor
+
+    backend_client.close()
+
+    assert backend_client._executor is None
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
+    # the one worker session, plus the client's own session
+    assert mock_close.call_count == 2
+
+
+def test_authorization_header_reused_within_ttl(mocker, backend_client):
+    mock_time = mocker.patch("garden_ai.backend_client.time")
+    mock_post_response(mocker, backend_client, {"doi": "10.26311/fake-doi"})
+    get_header = backend_client.garden_authorizer.get_authorization_header
+
+    mock_time.monotonic.return_value = 1000.0
+    backend_client.mint_doi_on_datacite({})
+    mock_time.monotonic.return_value = 1000.0 + BackendClient.AUTH_HEADER_TTL - 1
+    backend_client.mint_doi_on_datacite({})
+    assert get_header.call_count == 1
+
+    mock_time.monotonic.return_value = 1000.0 + BackendClient.AUTH_HEADER_TTL + 1
+    backend_client.mint_doi_on_datacite({})
+    assert get_header.call_count == 2
+
+
+def test_authorization_header_refreshed_after_401(mocker, backend_client):
+    unauthorized = mocker.Mock(status_code=401)
+    unauthorized.raise_for_status.side_effect = requests.HTTPError("401")
+    ok_response = mocker.Mock(status_code=200)
+    ok_response.json.return_value = {"doi": "10.26311/fake-doi"}
+    mocker.patch.object(
+        backend_client._session, "post", side_effect=[unauthorized, ok_response]
+    )
+    get_header = backend_client.garden_authorizer.get_authorization_header
+
+    with pytest.raises(requests.HTTPError):
+        backend_client.mint_doi_on_datacite({})
+    backend_client.mint_doi_on_datacite({})
+    assert get_header.call_count == 2
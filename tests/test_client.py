@@ -1,13 +1,14 @@
 import pytest
 
+import json
 import os
 
 from garden_ai import GardenClient
 from garden_ai.client import AuthException
+from garden_ai.globus_search import garden_search
 from globus_sdk import (
     AuthAPIError,
     AuthClient,
-    OAuthTokenResponse,
     SearchClient,
     ClientCredentialsAuthorizer,
     ConfidentialAppAuthClient,
@@ -33,9 +34,9 @@ def test_client_no_previous_tokens(
     mocker.patch("garden_ai.client.Prompt.ask").return_value = "my token"
     mocker.patch("garden_ai.client.typer.launch")
 
-    mock_search_client = mocker.MagicMock(SearchClient)
+    mock_search_client = mocker.MagicMock()
 
-    mock_token_response = mocker.MagicMock(OAuthTokenResponse)
+    mock_token_response = mocker.MagicMock()
     mock_token_response.by_resource_server = {
         "groups.api.globus.org": token,
         "search.api.globus.org": token,
@@ -120,7 +121,7 @@ def test_client_invalid_auth_token(
     mocker.patch("garden_ai.client.Prompt.ask").return_value = "my token"
     mocker.patch("garden_ai.client.typer.launch")
 
-    mock_token_response = mocker.MagicMock(OAuthTokenResponse)
+    mock_token_response = mocker.MagicMock()
     mock_token_response.data = {"id_token": identity_jwt}
     mock_token_response.by_resource_server = {"groups.api.globus.org": token}
     mock_token_response.status_code = "X"
@@ -171,3 +172,25 @@ def test_client_credentials_grant(cc_grant_tuple):
     assert gc.auth_client.oauth2_validate_token(gc.garden_authorizer.access_token)[
         "active"
     ]
+
+
+def test_get_published_garden_after_publish(
+    mocker, garden_client, garden_title_authors_doi_only, valid_search_by_subject
+):
+    garden_search._search_cache.clear()
+    mock_search_client = mocker.MagicMock()
+    mock_search_client.get_subject.return_value = mocker.Mock(
+        data=json.loads(valid_search_by_subject)
+    )
+    mocker.patch.object(garden_client, "search_client", mock_search_client)
+    mocker.patch.object(garden_client, "_fresh_mlflow_vars", return_value={})
+    mocker.patch.object(garden_client, "_update_datacite")
+    mocker.patch.object(garden_client.backend_client, "publish_garden_metadata")
+
+    doi = garden_title_authors_doi_only.doi
+    garden_client.get_published_garden(doi)
+    garden_client.publish_garden_metadata(garden_title_authors_doi_only)
+    garden_client.get_published_garden(doi)
+
+    # the lookup after publishing must not be served from the search cache
+    assert mock_search_client.get_subject.call_count == 2
@@ -1,14 +1,16 @@
-import os
+import copy
 import sys
 import json
 from collections import namedtuple
 from typing import Any, Iterable, List, Tuple, Union
 
+import dparse  # type: ignore
 import pytest
 from pydantic import ValidationError
 
 from garden_ai import Garden, Pipeline, RegisteredPipeline, Step, local_data, step
 from garden_ai.mlmodel import LocalModel, upload_to_model_registry
+from garden_ai.pipelines import _read_requirements_txt
 
 
 def test_create_empty_garden(garden_client):
@@ -49,6 +51,18 @@ def test_pipeline_datacite(garden_client):
     assert data["publisher"] == "thegardens.ai"
 
 
+def test_pipeline_datacite_reflects_updates(pipeline_toy_example):
+    pipeline = copy.copy(pipeline_toy_example)
+    first = pipeline.datacite_json()
+    assert pipeline.datacite_json() == first
+
+    pipeline.title = "Pea Edibility Pipeline, Revised"
+    data = json.loads(pipeline.datacite_json())
+    assert data["titles"] == [
+        {"title": "Pea Edibility Pipeline, Revised", "titleType": None, "lang": None}
+    ]
+
+
 def test_validate_no_fields(garden_no_fields):
     with pytest.raises(ValidationError):
         garden_no_fields.validate()
@@ -138,99 +152,59 @@ def test_steps_collect_source():
         return sum(xs)
 
 
-@pytest.mark.skipif(sys.version_info < (3, 10), reason="requires python3.10 or higher")
-def test_pipeline_compose_union(tmp_requirements_txt):
-    # check that pipelines can correctly compose tricky functions, which may be
-    # annotated like typing.Union *or* like (A | B)
-    @step
-    def wants_int_or_str(arg: int | str) -> str | int:
-        pass
-
-    @step
-    def wants_int_or_str_old_syntax(arg: Union[int, str]) -> Union[str, int]:
-        pass
-
-    @step
-    def str_only(arg: str) -> str:
-        pass
-
-    good = Pipeline(  # noqa: F841
-        authors=["mendel"],
-        requirements_file=str(tmp_requirements_txt),
-        title="good pipeline",
-        steps=[str_only, wants_int_or_str],
-        doi="10.26311/fake-doi",
-    )
-
-    also_good = Pipeline(  # noqa: F841
-        authors=["mendel"],
-        requirements_file=str(tmp_requirements_txt),
-        title="good pipeline",
-        steps=[str_only, wants_int_or_str_old_syntax],
-        doi="10.26311/fake-doi",
-    )
-
-    union_order_doesnt_matter = Pipeline(  # noqa: F841
+def _make_pipeline(requirements_file, steps):
+    return Pipeline(
         authors=["mendel"],
-        requirements_file=str(tmp_requirements_txt),
-        title="good pipeline",
-        steps=[wants_int_or_str, wants_int_or_str],
-        doi="10.26311/fake-doi",
-    )
-
-    union_syntax_doesnt_matter = Pipeline(  # noqa: F841
-        authors=["mendel"],
-        requirements_file=str(tmp_requirements_txt),
-        title="good pipeline",
-        steps=[wants_int_or_str, wants_int_or_str_old_syntax],
+        requirements_file=str(requirements_file),
+        title="test pipeline",
+        steps=steps,
         doi="10.26311/fake-doi",
     )
 
-    with pytest.raises(ValidationError):
-        union_str_does_not_subtype_str = Pipeline(  # noqa: F841
-            authors=["mendel"],
-            requirements_file=str(tmp_requirements_txt),
-            title="bad pipeline",
-            steps=[wants_int_or_str, str_only],
-            doi="10.26311/fake-doi",
-        )
 
-    with pytest.raises(ValidationError):
-        old_union_str_does_not_subtype_str = Pipeline(  # noqa: F841
-            authors=["mendel"],
-            requirements_file=str(tmp_requirements_txt),
-            title="bad pipeline",
-            steps=[wants_int_or_str_old_syntax, str_only],
-            doi="10.26311/fake-doi",
-        )
-    return
-
-
-def test_pipeline_compose_tuple(tmp_requirements_txt):
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="requires python3.10 or higher")
+@pytest.mark.parametrize(
+    "step_names,expect_error",
+    [
+        (["step_str_only", "step_wants_int_or_str"], False),
+        (["step_str_only", "step_wants_int_or_str_old_syntax"], False),
+        # union order doesn't matter
+        (["step_wants_int_or_str", "step_wants_int_or_str"], False),
+        # union syntax doesn't matter
+        (["step_wants_int_or_str", "step_wants_int_or_str_old_syntax"], False),
+        # union of str does not subtype str, with either syntax
+        (["step_wants_int_or_str", "step_str_only"], True),
+        (["step_wants_int_or_str_old_syntax", "step_str_only"], True),
+    ],
+)
+def test_pipeline_compose_union(
+    request, tmp_requirements_txt, step_names, expect_error
+):
+    # check that pipelines can correctly compose tricky functions, which may be
+    # annotated like typing.Union *or* like (A | B)
+    steps = [request.getfixturevalue(name) for name in step_names]
+    if expect_error:
+        with pytest.raises(ValidationError):
+            _make_pipeline(tmp_requirements_txt, steps)
+    else:
+        _make_pipeline(tmp_requirements_txt, steps)
+
+
+def test_pipeline_compose_tuple(
+    tmp_requirements_txt,
+    step_returns_tuple,
+    step_wants_tuple_as_tuple,
+    step_wants_tuple_as_args,
+    step_wants_flipped_tuple_as_args,
+):
     # check that pipelines can correctly compose tricky
     # functions which may or may not expect a plain tuple
     # to be treated as *args
-    @step
-    def returns_tuple(a: int, b: str) -> Tuple[int, str]:
-        pass
-
-    @step
-    def wants_tuple_as_tuple(t: Tuple[int, str]) -> int:
-        pass
-
-    @step
-    def wants_tuple_as_args(x: int, y: str) -> str:
-        pass
-
-    @step
-    def wants_flipped_tuple_as_args(arg1: str, arg2: int) -> float:
-        pass
-
     good = Pipeline(  # noqa: F841
         authors=["mendel"],
         requirements_file=str(tmp_requirements_txt),
         title="good pipeline",
-        steps=[returns_tuple, wants_tuple_as_tuple],
+        steps=[step_returns_tuple, step_wants_tuple_as_tuple],
         doi="10.26311/fake-doi",
     )
 
@@ -239,7 +213,7 @@ def test_pipeline_compose_tuple(tmp_requirements_txt):
             authors=["mendel"],
             requirements_file=str(tmp_requirements_txt),
             title="backwards pipeline",
-            steps=[wants_tuple_as_tuple, returns_tuple],
+            steps=[step_wants_tuple_as_tuple, step_returns_tuple],
             doi="10.26311/fake-doi",
         )
 
@@ -247,7 +221,7 @@ def test_pipeline_compose_tuple(tmp_requirements_txt):
         authors=["mendel"],
         requirements_file=str(tmp_requirements_txt),
         title="ugly (using *args) but allowed pipeline",
-        steps=[returns_tuple, wants_tuple_as_args],
+        steps=[step_returns_tuple, step_wants_tuple_as_args],
         doi="10.26311/fake-doi",
     )
     with pytest.raises(ValidationError):
@@ -255,36 +229,36 @@ def test_pipeline_compose_tuple(tmp_requirements_txt):
             authors=["mendel"],
             requirements_file=str(tmp_requirements_txt),
             title="ugly (using *args) and disallowed pipeline",
-            steps=[returns_tuple, wants_flipped_tuple_as_args],
+            steps=[step_returns_tuple, step_wants_flipped_tuple_as_args],
             doi="10.26311/fake-doi",
         )
 
 
-def test_step_authors_are_pipeline_contributors(pipeline_toy_example):
+def test_pipeline_is_callable(pipeline_toy_example):
+    # the complete pipeline is also callable by itself
+    assert pipeline_toy_example([1, 2, 3]) == 10 / 10
+
+
+def test_pipeline_invariants(pipeline_toy_example):
     pipe = pipeline_toy_example
+    # step authors are pipeline contributors
     for s in pipe.steps:
         for author in s.authors:
             assert author in pipe.contributors
         for contributor in s.contributors:
             assert contributor in pipe.contributors
 
-
-def test_sdk_pinned_in_pipeline_deps(pipeline_toy_example):
     # garden-ai should appear exactly once as an automatically-included dependency
-    assert 1 == sum(
-        req.startswith("garden-ai==") for req in pipeline_toy_example.pip_dependencies
-    )
-
+    assert 1 == sum(req.startswith("garden-ai==") for req in pipe.pip_dependencies)
 
-def test_upload_model(mocker, tmp_path):
-    model_dir_path = tmp_path / "models"
 
-    model_dir_path.mkdir(parents=True, exist_ok=True)
-    model_path = model_dir_path / "model.pkl"
-    model_path.write_text("abcd")
+def test_upload_model(mocker, monkeypatch, tmp_path):
+    # the model file is never really read, since pickle.load is mocked
+    model_path = "/nonexistent/models/model.pkl"
+    mocker.patch("garden_ai.mlmodel.open", mocker.mock_open(), create=True)
 
     # Prevents ML Flow from creating directory in /tests
-    os.environ["MLFLOW_TRACKING_URI"] = str(tmp_path)
+    monkeypatch.setenv("MLFLOW_TRACKING_URI", str(tmp_path))
 
     MLFlowVersionResponse = namedtuple("MLFlowVersionResponse", "version")
     versions_response = [MLFlowVersionResponse("1"), MLFlowVersionResponse("0")]
@@ -297,7 +271,7 @@ def test_upload_model(mocker, tmp_path):
 
     model_uri = "will@test.com-test_model/1"
     local_model = LocalModel(
-        local_path=str(model_path),
+        local_path=model_path,
         model_name="test_model",
         user_email="will@test.com",
         flavor="sklearn",
@@ -337,6 +311,44 @@ def test_pipeline_collects_own_requirements(
     assert "python=" not in "".join(pipeline_using_step_with_model.conda_dependencies)
 
 
+_PLAIN_REQS = "# comment\nFlask==2.1.1\npandas>=1.3.0\n\nnumpy==1.21.2\n"
+_HASH = "sha256:" + "0123456789abcdef" * 4
+
+
+@pytest.mark.parametrize(
+    "contents, uses_dparse",
+    [
+        (_PLAIN_REQS, False),
+        (_PLAIN_REQS + "scikit-learn>=0.24.2  # inline comment\n", True),
+        (_PLAIN_REQS + "-r other.txt\n", True),
+        (_PLAIN_REQS + f"scikit-learn==1.2.2 --hash={_HASH}\n", True),
+        (_PLAIN_REQS + "not a valid requirement!!\n", True),
+        (
+            "Flask==2.1.1  # inline comment\n-r other.txt\n"
+            f"numpy==1.21.2 --hash={_HASH}\n"
+            "--index-url https://example.com/simple\n"
+            "not a valid requirement!!\nscikit-learn>=0.24.2\n",
+            True,
+        ),
+    ],
+)
+def test_read_requirements_txt_matches_dparse(mocker, tmp_path, contents, uses_dparse):
+    (tmp_path / "other.txt").write_text("six==1.16.0\n")
+    requirements_file = tmp_path / "requirements.txt"
+    requirements_file.write_text(contents)
+
+    # what pipelines used to collect, by always going through dparse
+    parsed = dparse.parse(
+        contents, path=str(requirements_file), resolve=True
+    ).serialize()
+    expected = [d["line"] for d in parsed["dependencies"]]
+    expected += [d["line"] for d in parsed["resolved_dependencies"]]
+
+    spy = mocker.spy(dparse, "parse")
+    assert set(_read_requirements_txt(str(requirements_file))) == set(expected)
+    assert spy.called == uses_dparse
+
+
 def test_pipeline_does_not_collect_step_requirements(
     pipeline_using_step_with_model, step_with_model
 ):
@@ -1,7 +1,7 @@
+import json
 from dataclasses import dataclass
 import pytest
 
-from globus_sdk import SearchClient
 from garden_ai.globus_search import garden_search
 
 
@@ -9,9 +9,22 @@ from garden_ai.globus_search import garden_search
 class MockSearchResult:
     text: str
 
+    @property
+    def data(self):
+        # like GlobusHTTPResponse, parsed up front and None if not JSON
+        try:
+            return json.loads(self.text)
+        except ValueError:
+            return None
+
+
+@pytest.fixture(autouse=True)
+def clear_search_cache():
+    garden_search._search_cache.clear()
+
 
 def test_get_by_doi_valid(mocker, valid_search_by_subject):
-    mock_search_client = mocker.MagicMock(SearchClient)
+    mock_search_client = mocker.MagicMock()
     mock_search_client.get_subject = mocker.Mock(
         return_value=MockSearchResult(valid_search_by_subject)
     )
@@ -21,9 +34,107 @@ def test_get_by_doi_valid(mocker, valid_search_by_subject):
 
 
 def test_get_by_doi_none_found(mocker, empty_search_by_doi):
-    mock_search_client = mocker.MagicMock(SearchClient)
+    mock_search_client = mocker.MagicMock()
     mock_search_client.get_subject = mocker.Mock(
         return_value=MockSearchResult(empty_search_by_doi)
     )
     with pytest.raises(garden_search.RemoteGardenException):
         garden_search.get_remote_garden_by_doi("foo", {}, mock_search_client)
+
+
+def test_get_by_doi_not_json(mocker):
+    mock_search_client = mocker.MagicMock()
+    mock_search_client.get_subject = mocker.Mock(
+        return_value=MockSearchResult("<html>Bad Gateway</html>")
+    )
+    with pytest.raises(garden_search.RemoteGardenException):
+        garden_search.get_remote_garden_by_doi("foo", {}, mock_search_client)
+
+
+def test_get_by_doi_uses_cache(mocker, valid_search_by_subject):
+    mock_search_client = mocker.MagicMock()
+    mock_search_client.get_subject = mocker.Mock(
+        return_value=MockSearchResult(valid_search_by_subject)
+    )
+    garden_search.get_remote_garden_by_doi("foo", {}, mock_search_client)
+    garden_search.get_remote_garden_by_doi("foo", {}, mock_search_client)
+    assert mock_search_client.get_subject.call_count == 1
+
+    garden_search.get_remote_garden_by_doi(
+        "foo", {}, mock_search_client, use_cache=False
+    )
+    assert mock_search_client.get_subject.call_count == 2
+
+
+def test_get_by_doi_does_not_cache_invalid_garden(mocker, valid_search_by_subject):
+    search_result = json.loads(valid_search_by_subject)
+    search_result["entries"][0]["content"]["doi"] = None
+    mock_search_client = mocker.MagicMock()
+    mock_search_client.get_subject = mocker.Mock(
+        return_value=MockSearchResult(json.dumps(search_result))
+    )
+    for _ in range(2):
+        with pytest.raises(garden_search.RemoteGardenException):
+            garden_search.get_remote_garden_by_doi("foo", {}, mock_search_client)
+    assert mock_search_client.get_subject.call_count == 2
+
+
+def test_forget_remote_garden(mocker, valid_search_by_subject):
+    mock_search_client = mocker.MagicMock()
+    mock_search_client.get_subject = mocker.Mock(
+        return_value=MockSearchResult(valid_search_by_subject)
+    )
+    garden_search.get_remote_garden_by_doi("foo", {}, mock_search_client)
+    garden_search.forget_remote_garden("foo")
+    garden_search.get_remote_garden_by_doi("foo", {}, mock_search_client)
+    assert mock_search_client.get_subject.call_count == 2
+
+
+def test_get_by_dois(mocker, valid_search_by_subject, empty_search_by_doi):
+    search_result = json.loads(empty_search_by_doi)
+    search_result["gmeta"] = [json.loads(valid_search_by_subject)]
+    mock_search_client = mocker.MagicMock()
+    mock_search_client.search = mocker.Mock(
+        return_value=MockSearchResult(json.dumps(search_result))
+    )
+    gardens = garden_search.get_remote_gardens_by_dois(
+        ["10.26311/fake-doi", "10.26311/missing-doi"], {}, mock_search_client
+    )
+    mock_search_client.search.assert_called_once()
+    assert list(gardens) == ["10.26311/fake-doi"]
+    assert gardens["10.26311/fake-doi"].year == "1863"
+
+
+def test_get_by_dois_keys_by_requested_doi(
+    mocker, valid_search_by_subject, empty_search_by_doi
+):
+    hit = json.loads(valid_search_by_subject)
+    unrequested = json.loads(valid_search_by_subject)
+    unrequested["entries"][0]["content"]["doi"] = "10.26311/other-doi"
+    search_result = json.loads(empty_search_by_doi)
+    search_result["gmeta"] = [hit, unrequested]
+    mock_search_client = mocker.MagicMock()
+    mock_search_client.search = mocker.Mock(
+        return_value=MockSearchResult(json.dumps(search_result))
+    )
+
+    gardens = garden_search.get_remote_gardens_by_dois(
+        ["10.26311/FAKE-DOI"], {}, mock_search_client
+    )
+
+    assert list(gardens) == ["10.26311/FAKE-DOI"]
+    assert list(garden_search._search_cache) == [
+        (garden_search.GARDEN_INDEX_UUID, "10.26311/FAKE-DOI")
+    ]
+
+
+def test_get_by_dois_escapes_query(mocker, empty_search_by_doi):
+    mock_search_client = mocker.MagicMock()
+    mock_search_client.search = mocker.Mock(
+        return_value=MockSearchResult(empty_search_by_doi)
+    )
+    garden_search.get_remote_gardens_by_dois(
+        ['10.26311/a"b', "10.26311/c\\d"], {}, mock_search_client
+    )
+    query = mock_search_client.search.call_args.args[1]
+    assert query == '(doi: "10.26311/a\\"b") OR (doi: "10.26311/c\\\\d")'
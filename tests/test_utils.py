@@ -1,7 +1,13 @@
+import traceback
+from inspect import signature
+from typing import Tuple
+
 import pytest
 
 from garden_ai.utils.misc import (
     InvalidRequirement,
+    check_composable,
+    compose_steps,
     extract_email_from_globus_jwt,
     validate_pip_lines,
 )
@@ -38,3 +44,49 @@ def test_validate_pip_lines():
             "https://github.com/user/package/archive/v1.0.0.tar.gz",
         ]
         result = validate_pip_lines(valid_lines + invalid_lines)
+
+
+def test_check_composable():
+    def returns_tuple(a: int) -> Tuple[int, str]:
+        pass
+
+    def wants_tuple_as_args(x: int, y: str) -> str:
+        pass
+
+    def wants_int(x: int) -> int:
+        pass
+
+    check_composable(wants_tuple_as_args, returns_tuple)
+    with pytest.raises(TypeError):
+        check_composable(wants_int, returns_tuple)
+
+
+def test_compose_steps():
+    def returns_tuple(a: int) -> Tuple[int, str]:
+        return a, str(a)
+
+    def wants_tuple_as_args(x: int, y: str) -> str:
+        return y * x
+
+    def wants_str(s: str) -> int:
+        return len(s)
+
+    composed = compose_steps([returns_tuple, wants_tuple_as_args, wants_str])
+    assert composed(3) == 3
+    assert str(signature(composed)) == "(a: int) -> int"
+
+
+def test_compose_steps_traceback():
+    def returns_int(a: int) -> int:
+        return a
+
+    def fails(x: int) -> int:
+        raise ValueError("bad soup")
+
+    composed = compose_steps([returns_int, fails])
+    with pytest.raises(ValueError) as excinfo:
+        composed(1)
+
+    frame = traceback.extract_tb(excinfo.tb)[1]
+    assert frame.filename == "<composed steps: returns_int -> fails>"
+    assert frame.line == "return s1(s0(*args, **kwargs))"